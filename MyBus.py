@@ -1,15 +1,23 @@
 import json
 import requests
+from requests.adapters import HTTPAdapter
 import logging
 from datetime import datetime, timezone
-import pytz
-from multiprocessing import Queue
+from zoneinfo import ZoneInfo
+from queue import Queue, Empty
 import os
 import pygame
 import time
 import io
 import re
 import math
+import sys
+from collections import namedtuple
+import heapq
+import threading
+import calendar
+import array
+from concurrent.futures import Future, ThreadPoolExecutor
 
 try:
     from rgbmatrix import RGBMatrix, RGBMatrixOptions, graphics
@@ -20,21 +28,19 @@ except ImportError:
     graphics = None
     _HAS_RGBMATRIX = False
 
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    _HAS_ORJSON = False
+
 # Display configuration
 DISPLAY_BACKEND_ENV_VAR = "MYBUS_DISPLAY_BACKEND"
 FONT_PATH_ENV_VAR = "MATRIX_FONT_PATH"
+FULL_FLIP_ENV_VAR = "MYBUS_FULL_FLIP"
 DEFAULT_DISPLAY_BACKEND = 'matrix' if _HAS_RGBMATRIX else 'pygame'
 
-try:
-    import cairosvg
-    _HAS_CAIROSVG = True
-except Exception:
-    cairosvg = None
-    _HAS_CAIROSVG = False
-
-# Initialize Pygame
-pygame.init()
-
 # Constants for display
 SCREEN_WIDTH = 720
 # Make height half the width so height:width == 1:2
@@ -46,29 +52,62 @@ STOP_TEXT_COLOR = (0, 142, 255)  # Blue for stop names
 ARRIVAL_COLOR = (0, 255, 0)  # Green
 WARNING_COLOR = (255, 165, 0)  # Orange
 URGENT_COLOR = (255, 0, 0)  # Red
+# Bottom band holding the logo, timestamp and view label; redrawn on its own
+# when only the clock has changed
+FOOTER_RECT = pygame.Rect(0, SCREEN_HEIGHT - 50, SCREEN_WIDTH, 50)
+# Fall back to a full flip when the dirty area exceeds this share of the screen
+FULL_FLIP_RATIO = 0.6
+DISPLAY_FPS = 10
+
+# Font sizes (fonts are built lazily by _font)
+HEADER_FONT_SIZE = 46
+ROUTE_FONT_SIZE = 38
+TIME_FONT_SIZE = 32
+SMALL_FONT_SIZE = 28
 
-# Fonts
-header_font = pygame.font.Font(None, 46)
-route_font = pygame.font.Font(None, 38)
-badge_font = pygame.font.Font(None, 32)
-time_font = pygame.font.Font(None, 32)
-small_font = pygame.font.Font(None, 28)
 STOP_TEXT_LEFT_OFFSET = 0
 MATRIX_CENTER_MARGIN = 2
 MATRIX_SPACE_WIDTH = 1
 CUSTOM_SPACE_SCALE = 0.55
+TEXT_CACHE_LIMIT = 256
+ROUTE_LOGO_DIR = os.path.join(os.path.dirname(__file__), 'logo', 'routes')
+_NON_ALNUM_RE = re.compile(r'[^A-Za-z0-9]')
+# Subway trains closer than this many minutes are not shown
+SUBWAY_MIN_MINUTES = 10
+
+
+# Route badge colors keyed by the route's first letter; tweak these RGB tuples to taste
+_ROUTE_COLOR_BY_INITIAL = {
+    'B': (30, 115, 190),  # Brooklyn buses — blue like the attached example
+    'M': (200, 16, 46),  # Manhattan — use a darker red
+    'Q': (0, 128, 128),  # Queens — teal
+    'S': (255, 140, 0),  # Staten Island / Special — orange
+}
+
+# Default pygame fonts keyed by size
+_FONT_CACHE = {}
+
+
+def _font(size):
+    """Return the default pygame font at the given size, creating it on first use."""
+    font = _FONT_CACHE.get(size)
+    if font is None:
+        font = pygame.font.Font(None, size)
+        _FONT_CACHE[size] = font
+    return font
+
+
+_NASSAU_AV_SEARCH = re.compile(r'nassau av/', re.IGNORECASE).search
 
 
 def _extract_after_nassau_av(stop_name):
     """Return the substring after 'Nassau Av/' (case-insensitive)."""
     if not stop_name:
         return None
-    marker = 'nassau av/'
-    lower_name = stop_name.lower()
-    idx = lower_name.find(marker)
-    if idx == -1:
+    match = _NASSAU_AV_SEARCH(stop_name)
+    if match is None:
         return None
-    tail = stop_name[idx + len(marker):].strip()
+    tail = stop_name[match.end():].strip()
     return tail or None
 
 
@@ -120,30 +159,113 @@ def _is_subway_or_rail_route(route_type):
     return any(token in lowered for token in ('subway', 'rail', 'heavy'))
 
 
+# One upcoming arrival as produced by the bus and subway parsers. A tuple keeps
+# each record compact and cheap to build compared to a per-arrival dict.
+# For subway arrivals route_long_name holds the train's destination.
+# arrival_epoch lets minutes_to_arrival be refreshed between fetches.
+Arrival = namedtuple('Arrival', [
+    'route_short_name',
+    'route_long_name',
+    'route_type',
+    'arrival_time',
+    'formatted_time',
+    'minutes_to_arrival',
+    'direction_id',
+    'status',
+    'stop_name',
+    'track',
+    'center_label',
+    'arrival_epoch',
+], defaults=(None, None, None))
+
+
 def get_arrival_center_label(arrival):
     """Determine the friendly center label for an arrival row."""
-    if not isinstance(arrival, dict):
+    if not isinstance(arrival, Arrival):
         return 'Transit'
 
-    if _is_subway_or_rail_route(arrival.get('route_type')):
-        destination = arrival.get('destination') or arrival.get('route_long_name')
+    if _is_subway_or_rail_route(arrival.route_type):
+        destination = arrival.route_long_name
         if destination:
             return destination
 
-    cross_street = _extract_after_nassau_av(arrival.get('stop_name'))
+    cross_street = _extract_after_nassau_av(arrival.stop_name)
     if cross_street:
         return cross_street
 
     return (
-        arrival.get('stop_name')
-        or arrival.get('route_long_name')
-        or arrival.get('route_short_name')
+        arrival.stop_name
+        or arrival.route_long_name
+        or arrival.route_short_name
         or 'Transit'
     )
 
 
+def _arrivals_signature(arrivals):
+    """Return a hashable summary of the arrival fields that end up on screen."""
+    return tuple(
+        (a.route_short_name, a.route_long_name, a.stop_name, a.minutes_to_arrival)
+        for a in arrivals or ()
+    )
+
+
+def _finalize_arrivals(arrivals):
+    """Fill in the display-only fields for arrivals that survived the top-K trim.
+
+    Parsers leave formatted_time empty so the timezone conversion and strftime
+    only run for the handful of rows that are kept, and the center label is
+    stored so displays don't recompute it per frame.
+    """
+    return [
+        arrival._replace(
+            formatted_time=format_arrival_time(arrival.arrival_time),
+            center_label=get_arrival_center_label(arrival),
+            arrival_epoch=_arrival_epoch(arrival),
+        )
+        for arrival in arrivals
+    ]
+
+
+def _arrival_epoch(arrival):
+    """Return the arrival's epoch seconds, parsing arrival_time if it wasn't stored"""
+    if arrival.arrival_epoch is not None:
+        return arrival.arrival_epoch
+    if not arrival.arrival_time:
+        return None
+    try:
+        return _iso_to_epoch(arrival.arrival_time)
+    except (ValueError, TypeError):
+        return None
+
+
+def refresh_minutes(arrivals, now_ts=None):
+    """Recompute minutes_to_arrival from each arrival's epoch.
+
+    Snapshots only arrive once per fetch interval, so this keeps the countdown
+    on screen current in between. Subway arrivals that count down past
+    SUBWAY_MIN_MINUTES are dropped, as the subway parser would on a refetch.
+    """
+    if now_ts is None:
+        now_ts = time.time()
+    refreshed = []
+    for arrival in arrivals:
+        if arrival.arrival_epoch is not None:
+            minutes = int((arrival.arrival_epoch - now_ts) / 60)
+            minutes = minutes if minutes > 0 else 0
+            if arrival.route_type == _ROUTE_TYPE_SUBWAY and minutes < SUBWAY_MIN_MINUTES:
+                continue
+            if minutes != arrival.minutes_to_arrival:
+                arrival = arrival._replace(minutes_to_arrival=minutes)
+        refreshed.append(arrival)
+    return refreshed
+
+
 class BusArrivalDisplay:
-    def __init__(self):
+    def __init__(self, display_config=None):
+        display_config = display_config or {}
+        # Pygame is only initialized when this backend is actually used
+        if not pygame.get_init():
+            pygame.init()
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Live Bus Arrivals")
         self.clock = pygame.time.Clock()
@@ -154,6 +276,23 @@ class BusArrivalDisplay:
         self.logo = None
         # Cache for per-route logos (pygame.Surface)
         self.route_logos = {}
+        # Cache of resolved route logo paths (None when no file exists)
+        self._route_path_cache = {}
+        # Cache for rendered text surfaces keyed by (font, text, color, spaced)
+        self._text_cache = {}
+        # Keys of what is currently on screen, used to skip or narrow redraws
+        self._last_arrivals_key = None
+        self._last_footer_key = None
+        # Partial updates are used unless full flips are requested, for setups
+        # where the driver doesn't honour dirty-rect updates reliably
+        full_flip = display_config.get('full_flip', False)
+        full_flip_env = os.environ.get(FULL_FLIP_ENV_VAR)
+        if full_flip_env is not None:
+            full_flip = full_flip_env.strip().lower() in ('1', 'true', 'yes')
+        self._partial_updates = not full_flip
+        # Formatted wall-clock string, refreshed once per second
+        self._last_time_str = ''
+        self._last_time_sec = -1
         try:
             logo_path = os.path.join(os.path.dirname(__file__), 'logo', 'MTA-Metropolitan-Transportation-Authority-Logo.png')
             if os.path.exists(logo_path):
@@ -164,19 +303,33 @@ class BusArrivalDisplay:
                 self.logo = pygame.transform.smoothscale(img, (w, target_h))
         except Exception as e:
             logging.warning(f"Could not load logo image: {e}")
+        # Static layer copied onto the screen before the dynamic content is drawn
+        self._background = self._build_background()
+
+    def _build_background(self):
+        """Render the static parts of the screen (background color and logo) once."""
+        background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        background.fill(BACKGROUND_COLOR)
+        # If a logo was loaded, draw it to the bottom-left above the footer
+        if self.logo:
+            logo_x = 10
+            logo_y = SCREEN_HEIGHT - self.logo.get_height() - 8
+            background.blit(self.logo, (logo_x, logo_y))
+        return background
 
     def _route_logo_path(self, route_short_name):
         """Return the expected path for a route logo file (prefer svg then png)."""
         if not route_short_name:
             return None
-        base = os.path.join(os.path.dirname(__file__), 'logo', 'routes')
 
         # Candidate name variants to try, in order
         raw = str(route_short_name).strip()
+        if raw in self._route_path_cache:
+            return self._route_path_cache[raw]
         candidates = []
         candidates.append(raw)
         # alphanumeric only (strip punctuation/whitespace)
-        alnum = re.sub(r'[^A-Za-z0-9]', '', raw)
+        alnum = _NON_ALNUM_RE.sub('', raw)
         if alnum and alnum not in candidates:
             candidates.append(alnum)
         # first character (common for multi-letter IDs like 'NQRW')
@@ -186,16 +339,20 @@ class BusArrivalDisplay:
                 candidates.append(first)
 
         # Try each candidate for png first (prefer pre-generated PNGs), then svg
+        path = None
         for name in candidates:
             name_l = name.lower()
-            png_path = os.path.join(base, f"{name_l}.png")
-            svg_path = os.path.join(base, f"{name_l}.svg")
+            png_path = os.path.join(ROUTE_LOGO_DIR, f"{name_l}.png")
+            svg_path = os.path.join(ROUTE_LOGO_DIR, f"{name_l}.svg")
             if os.path.exists(png_path):
-                return png_path
+                path = png_path
+                break
             if os.path.exists(svg_path):
-                return svg_path
+                path = svg_path
+                break
 
-        return None
+        self._route_path_cache[raw] = path
+        return path
 
     def load_route_logo(self, route_short_name, target_h=48):
         """Load and cache a route logo as a pygame.Surface.
@@ -217,22 +374,31 @@ class BusArrivalDisplay:
 
         try:
             if path.lower().endswith('.svg'):
-                if not _HAS_CAIROSVG:
+                # cairosvg pulls in the cairo C libraries, so only import it when an SVG is needed
+                try:
+                    import cairosvg
+                except Exception:
                     logging.warning("cairosvg not available; cannot load SVG logos. Install cairosvg to enable route logos.")
                     self.route_logos[key] = None
                     return None
 
-                # Convert SVG bytes to PNG bytes
+                # Convert SVG bytes to PNG bytes, rasterized directly at the target height
                 with open(path, 'rb') as f:
                     svg_bytes = f.read()
-                png_bytes = cairosvg.svg2png(bytestring=svg_bytes)
+                png_bytes = cairosvg.svg2png(bytestring=svg_bytes, output_height=target_h)
                 surf = pygame.image.load(io.BytesIO(png_bytes), 'png')
+                # Match the display pixel format so blits skip per-pixel conversion
+                try:
+                    surf = surf.convert_alpha()
+                except pygame.error as e:
+                    logging.warning(f"Could not convert route logo for {route_short_name}: {e}")
             else:
                 surf = pygame.image.load(path).convert_alpha()
 
-            # Scale to height target_h while preserving aspect
-            w = int(surf.get_width() * (target_h / surf.get_height()))
-            surf = pygame.transform.smoothscale(surf, (w, target_h))
+            # Scale to height target_h while preserving aspect (SVGs already match)
+            if surf.get_height() != target_h:
+                w = int(surf.get_width() * (target_h / surf.get_height()))
+                surf = pygame.transform.scale(surf, (w, target_h))
             self.route_logos[key] = surf
             return surf
         except Exception as e:
@@ -240,6 +406,30 @@ class BusArrivalDisplay:
             self.route_logos[key] = None
             return None
 
+    def _render(self, font, text, color, spaced=False):
+        """Render text through a small surface cache so repeated strings are reused."""
+        key = (id(font), text, color, spaced)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            # Labels and countdowns churn slowly; dropping everything on overflow
+            # keeps the cache bounded and only re-renders what the next frame uses.
+            if len(self._text_cache) >= TEXT_CACHE_LIMIT:
+                self._text_cache.clear()
+            if spaced:
+                surf = render_text_with_custom_space(font, text, color)
+            else:
+                surf = font.render(text, True, color)
+            self._text_cache[key] = surf
+        return surf
+
+    def _current_time_str(self):
+        """Return the current time as HH:MM:SS AM/PM, formatting at most once a second."""
+        sec = int(time.time())
+        if sec != self._last_time_sec:
+            self._last_time_str = datetime.now().strftime('%I:%M:%S %p')
+            self._last_time_sec = sec
+        return self._last_time_str
+
     def get_arrival_color(self, minutes_to_arrival):
         """Get color based on arrival time"""
         if minutes_to_arrival is None:
@@ -263,39 +453,25 @@ class BusArrivalDisplay:
 
         r = str(route_short_name).upper()
 
-        # Basic heuristic mapping; tweak these RGB tuples to taste
-        if r.startswith('B'):
-            # Brooklyn buses — blue like the attached example
-            return (30, 115, 190)
-        if r.startswith('M'):
-            # Manhattan — use a darker red
-            return (200, 16, 46)
-        if r.startswith('Q'):
-            # Queens — teal
-            return (0, 128, 128)
-        if r.startswith('S'):
-            # Staten Island / Special — orange
-            return (255, 140, 0)
-
-        # Fallback: white
-        return HEADER_COLOR
+        # Borough initial picks the badge color; anything else falls back to white
+        return _ROUTE_COLOR_BY_INITIAL.get(r[:1], HEADER_COLOR)
 
 
     def draw_header(self, stop_name):
         """Draw the header section"""
         # Main title
-        title_text = header_font.render("Live Bus Arrivals", True, HEADER_COLOR)
+        title_text = self._render(_font(HEADER_FONT_SIZE), "Live Bus Arrivals", HEADER_COLOR)
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 30))
         self.screen.blit(title_text, title_rect)
 
         # Stop name
-        stop_text = route_font.render(f"{stop_name}", True, TEXT_COLOR)
+        stop_text = self._render(_font(ROUTE_FONT_SIZE), f"{stop_name}", TEXT_COLOR)
         stop_rect = stop_text.get_rect(center=(SCREEN_WIDTH // 2, 65))
         self.screen.blit(stop_text, stop_rect)
 
         # Current time
-        current_time = datetime.now().strftime('%I:%M:%S %p')
-        time_text = time_font.render(f"Updated: {current_time}", True, TEXT_COLOR)
+        current_time = self._current_time_str()
+        time_text = self._render(_font(TIME_FONT_SIZE), f"Updated: {current_time}", TEXT_COLOR)
         time_rect = time_text.get_rect(center=(SCREEN_WIDTH // 2, 90))
         self.screen.blit(time_text, time_rect)
 
@@ -309,9 +485,9 @@ class BusArrivalDisplay:
 
     def draw_footer(self):
         """Draw a small last-updated footer at the bottom of the screen"""
-        current_time = datetime.now().strftime('%I:%M:%S %p')
+        current_time = self._current_time_str()
         # Center timestamp
-        footer_text = small_font.render(f"Last Updated: {current_time}", True, HEADER_COLOR)
+        footer_text = self._render(_font(SMALL_FONT_SIZE), f"Last Updated: {current_time}", HEADER_COLOR)
         footer_rect = footer_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 24))
         self.screen.blit(footer_text, footer_rect)
         # Show current view mode on the bottom-right
@@ -319,14 +495,10 @@ class BusArrivalDisplay:
             mode_label = self.view_mode.capitalize()
         except Exception:
             mode_label = 'Combined'
-        mode_text = small_font.render(f"View: {mode_label}", True, HEADER_COLOR)
+        mode_text = self._render(_font(SMALL_FONT_SIZE), f"View: {mode_label}", HEADER_COLOR)
         mode_rect = mode_text.get_rect(midright=(SCREEN_WIDTH - 12, SCREEN_HEIGHT - 24))
         self.screen.blit(mode_text, mode_rect)
-        # If a logo was loaded, draw it to the bottom-left above the footer
-        if getattr(self, 'logo', None):
-            logo_x = 10
-            logo_y = SCREEN_HEIGHT - self.logo.get_height() - 8
-            self.screen.blit(self.logo, (logo_x, logo_y))
+        # The logo is part of the prerendered background
 
     def set_view(self, mode):
         """Set the current view mode. Expected values: 'combined', 'subway', 'bus'."""
@@ -354,13 +526,15 @@ class BusArrivalDisplay:
         left_x = 80
         right_x = SCREEN_WIDTH - 80
 
+        # Collect row blits so they go to the screen in a single call
+        blits = []
         for i, item in enumerate(visible):
             y_pos = start_y + i * line_height
 
             # Extract display pieces with sensible fallbacks
-            route = item.get('route_short_name') or item.get('route_long_name') or item.get('route_short') or '—'
-            stop = item.get('stop_name') or item.get('route_long_name') or 'Unknown'
-            minutes = item.get('minutes_to_arrival')
+            route = item.route_short_name or item.route_long_name or '—'
+            stop = item.stop_name or item.route_long_name or 'Unknown'
+            minutes = item.minutes_to_arrival
 
             # Format minutes text
             if minutes is None:
@@ -376,31 +550,41 @@ class BusArrivalDisplay:
             # Get route color for stop text
             route_color = self.get_route_color(route)
 
-            center_text_value = _normalize_stop_label(get_arrival_center_label(item))
+            center_text_value = _normalize_stop_label(item.center_label or get_arrival_center_label(item))
 
             # Display stop text starting from the left
             center_color = route_color or STOP_TEXT_COLOR
-            center_surf = render_text_with_custom_space(route_font, center_text_value, center_color)
+            center_surf = self._render(_font(ROUTE_FONT_SIZE), center_text_value, center_color, spaced=True)
             center_rect = center_surf.get_rect(midleft=(left_x, y_pos))
-            self.screen.blit(center_surf, center_rect)
+            blits.append((center_surf, center_rect))
 
             # Minutes text in white (user requested white text except for the line badge)
-            right_surf = time_font.render(str(minutes_text), True, HEADER_COLOR)
+            right_surf = self._render(_font(TIME_FONT_SIZE), str(minutes_text), HEADER_COLOR)
             right_rect = right_surf.get_rect(midright=(right_x, y_pos))
-            self.screen.blit(right_surf, right_rect)
+            blits.append((right_surf, right_rect))
 
-            # Separator between rows
-            if i < len(visible) - 1:
-                sep_y = y_pos + line_height // 2 - 6
-                pygame.draw.line(self.screen, (64, 64, 64), (50, sep_y), (SCREEN_WIDTH - 50, sep_y), 1)
+        self.screen.blits(blits, doreturn=0)
+
+        # Separator between rows
+        for i in range(len(visible) - 1):
+            sep_y = start_y + i * line_height + line_height // 2 - 6
+            pygame.draw.line(self.screen, (64, 64, 64), (50, sep_y), (SCREEN_WIDTH - 50, sep_y), 1)
 
     def draw_no_arrivals(self):
         """Draw message when no arrivals available"""
-        no_data_text = route_font.render("🔭 No arrival information available", True, WARNING_COLOR)
+        no_data_text = self._render(_font(ROUTE_FONT_SIZE), "🔭 No arrival information available", WARNING_COLOR)
         no_data_rect = no_data_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
         self.screen.blit(no_data_text, no_data_rect)
         # Footer will display last-updated time; keep the main message centered
 
+    def _present(self, dirty_rects):
+        """Push the dirty regions to the display, flipping when that is cheaper."""
+        dirty_area = sum(rect.width * rect.height for rect in dirty_rects)
+        if not self._partial_updates or dirty_area > FULL_FLIP_RATIO * SCREEN_WIDTH * SCREEN_HEIGHT:
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty_rects)
+
     def display_arrivals(self, arrivals):
         """Main display function - replaces the console print version"""
         # Handle pygame events
@@ -412,25 +596,46 @@ class BusArrivalDisplay:
                 if event.key == pygame.K_ESCAPE:
                     self.running = False
                     return False
-
-        # Clear screen
-        self.screen.fill(BACKGROUND_COLOR)
-
-        if arrivals:
-            # Draw arrivals list and footer (header removed per user request)
-            self.draw_arrivals(arrivals)
+            elif event.type == pygame.VIDEOEXPOSE:
+                # Window contents were lost; force a full repaint
+                self._last_arrivals_key = None
+
+        # Only the fields that end up on screen decide whether rows need redrawing
+        arrivals_key = _arrivals_signature(arrivals)
+        footer_key = (self._current_time_str(), self.view_mode)
+
+        dirty_rects = []
+        if arrivals_key != self._last_arrivals_key:
+            # Reset the screen to the static background
+            self.screen.blit(self._background, (0, 0))
+
+            if arrivals:
+                # Draw arrivals list and footer (header removed per user request)
+                self.draw_arrivals(arrivals)
+            else:
+                self.draw_no_arrivals()
             self.draw_footer()
-        else:
-            self.draw_no_arrivals()
+            dirty_rects.append(self.screen.get_rect())
+        elif footer_key != self._last_footer_key:
+            # Only the clock or view label moved; repaint just the footer band
+            self.screen.blit(self._background, FOOTER_RECT, FOOTER_RECT)
             self.draw_footer()
+            dirty_rects.append(FOOTER_RECT)
+
+        self._last_arrivals_key = arrivals_key
+        self._last_footer_key = footer_key
 
         # Update display
-        pygame.display.flip()
-        self.clock.tick(60)
+        if dirty_rects:
+            self._present(dirty_rects)
+        # Content changes at most once a second, so a low frame rate is plenty
+        self.clock.tick(DISPLAY_FPS)
         return True
 
     def cleanup(self):
         """Clean up pygame resources"""
+        # Fonts don't survive pygame.quit(); drop them so a new display rebuilds them
+        _FONT_CACHE.clear()
         pygame.quit()
 
 
@@ -464,6 +669,8 @@ if _HAS_RGBMATRIX:
                     f"Set {FONT_PATH_ENV_VAR} or copy the font from hzeller/rpi-rgb-led-matrix/fonts."
                 )
             self.font.LoadFont(font_path)
+            # ASCII glyph widths, looked up per character when measuring/drawing text
+            self._char_widths = array.array('i', (self._char_width(code) for code in range(128)))
 
             self.compact_mode = matrix_config.get('compact_mode', True)
             preferred_lines = matrix_config.get('max_lines', 4)
@@ -499,11 +706,15 @@ if _HAS_RGBMATRIX:
             self.header_color = graphics.Color(*matrix_config.get('header_color', (0, 255, 0)))
             self.warning_color = graphics.Color(255, 165, 0)
             self.urgent_color = graphics.Color(255, 0, 0)
+            # Route colors keyed by the route's first letter
             self.route_color_overrides = {
                 'G': graphics.Color(0, 255, 0),
                 'B': graphics.Color(30, 115, 190),
             }
             self.view_mode = 'combined'
+            # Last rows built by _build_rows and the arrivals signature they came from
+            self._last_sig = None
+            self._last_rows = None
             self._scroll_offsets = {}
             self._scroll_delay_until = {}
             delay_value = matrix_config.get('scroll_delay_seconds', 5)
@@ -529,53 +740,46 @@ if _HAS_RGBMATRIX:
             limit = self.max_chars if max_chars is None else max(1, max_chars)
             return text[:limit]
 
+        def _char_width(self, code):
+            """Width of a single character code, using the custom space width."""
+            char_width_func = getattr(self.font, 'CharacterWidth', None)
+            if callable(char_width_func):
+                if code == 32:
+                    return MATRIX_SPACE_WIDTH
+                try:
+                    return char_width_func(code)
+                except Exception:
+                    pass
+            return max(1, getattr(self.font, 'height', 8) // 2)
+
         def _text_width(self, text):
             if not text:
                 return 0
-            char_width_func = getattr(self.font, 'CharacterWidth', None)
-            if callable(char_width_func):
-                total = 0
-                for ch in text:
-                    if ch == ' ':
-                        total += MATRIX_SPACE_WIDTH
-                    else:
-                        try:
-                            total += char_width_func(ord(ch))
-                        except Exception:
-                            total += max(1, getattr(self.font, 'height', 8) // 2)
-                return total
-            return len(text) * max(1, getattr(self.font, 'height', 8) // 2)
-
-        def _draw_text_custom(self, x, y, color, text):
+            widths = self._char_widths
+            return sum(widths[code] if code < 128 else self._char_width(code) for code in map(ord, text))
+
+        def _draw_text_custom(self, x, y, color, text, canvas, font, draw):
             """Draw text with custom space width between words."""
             if not text:
                 return
-            char_width_func = getattr(self.font, 'CharacterWidth', None)
+            widths = self._char_widths
             cursor_x = x
             for ch in text:
+                code = ord(ch)
                 if ch == ' ':
                     cursor_x += MATRIX_SPACE_WIDTH
-                else:
-                    graphics.DrawText(self.canvas, self.font, cursor_x, y, color, ch)
-                    if callable(char_width_func):
-                        try:
-                            cursor_x += char_width_func(ord(ch))
-                        except Exception:
-                            cursor_x += max(1, getattr(self.font, 'height', 8) // 2)
-                    else:
-                        cursor_x += max(1, getattr(self.font, 'height', 8) // 2)
+                    continue
+                draw(canvas, font, cursor_x, y, color, ch)
+                cursor_x += widths[code] if code < 128 else self._char_width(code)
 
         def _get_route_color(self, route_name):
             if not route_name:
                 return self.text_color
             key = route_name.strip().upper()
-            for prefix, color in self.route_color_overrides.items():
-                if key.startswith(prefix):
-                    return color
-            return self.text_color
+            return self.route_color_overrides.get(key[:1], self.text_color)
 
         def _format_center_text(self, arrival):
-            center_label = get_arrival_center_label(arrival)
+            center_label = arrival.center_label or get_arrival_center_label(arrival)
             label = self._capitalize_first_letter(center_label)
             return label
 
@@ -603,9 +807,9 @@ if _HAS_RGBMATRIX:
                 return rows
 
             for arrival in arrivals[: self.max_arrivals]:
-                route_name = arrival.get('route_short_name') or arrival.get('route_long_name') or 'Route'
+                route_name = arrival.route_short_name or arrival.route_long_name or 'Route'
                 center_text = self._format_center_text(arrival)
-                minutes_text, minutes_color = self._format_minutes_text(arrival.get('minutes_to_arrival'))
+                minutes_text, minutes_color = self._format_minutes_text(arrival.minutes_to_arrival)
                 rows.append({
                     'type': 'arrival',
                     'route_color': self._get_route_color(route_name),
@@ -616,7 +820,7 @@ if _HAS_RGBMATRIX:
 
             return rows[: self.max_lines]
 
-        def _draw_arrival_row(self, row, y, row_index):
+        def _draw_arrival_row(self, row, y, row_index, canvas, font, draw):
             center_text = row['center_text']
             center_color = row.get('route_color') or self.header_color
             center_x = 1
@@ -660,13 +864,21 @@ if _HAS_RGBMATRIX:
                 self._scroll_offsets.pop(scroll_key, None)
                 self._scroll_delay_until.pop(scroll_key, None)
 
-            self._draw_text_custom(center_x, y, center_color, display_text)
+            self._draw_text_custom(center_x, y, center_color, display_text, canvas, font, draw)
 
-            graphics.DrawText(self.canvas, self.font, minutes_x, y, row['minutes_color'], minutes_text)
+            draw(canvas, font, minutes_x, y, row['minutes_color'], minutes_text)
 
         def display_arrivals(self, arrivals):
-            self.canvas.Clear()
-            rows = self._build_rows(arrivals)
+            # Local aliases keep attribute lookups out of the per-character draw loop
+            canvas = self.canvas
+            font = self.font
+            draw = graphics.DrawText
+            canvas.Clear()
+            sig = _arrivals_signature((arrivals or [])[: self.max_arrivals])
+            if sig != self._last_sig or self._last_rows is None:
+                self._last_rows = self._build_rows(arrivals)
+                self._last_sig = sig
+            rows = self._last_rows
             for idx, row in enumerate(rows):
                 row_top = self.top_padding + idx * self.row_stride
                 y = row_top + self.row_height
@@ -674,10 +886,10 @@ if _HAS_RGBMATRIX:
                     msg_text = row['text']
                     msg_width = self._text_width(msg_text)
                     msg_x = max(1, (self.cols - msg_width) // 2)
-                    graphics.DrawText(self.canvas, self.font, msg_x, y, self.warning_color, msg_text)
+                    draw(canvas, font, msg_x, y, self.warning_color, msg_text)
                 else:
-                    self._draw_arrival_row(row, y, idx)
-            self.canvas = self.matrix.SwapOnVSync(self.canvas)
+                    self._draw_arrival_row(row, y, idx, canvas, font, draw)
+            self.canvas = self.matrix.SwapOnVSync(canvas)
             return True
 
         def cleanup(self):
@@ -735,23 +947,94 @@ def safe_get_nested_value(data, *keys, default=None):
     return data
 
 
+# Parsed configs keyed by path, stored as (mtime, config)
+_CONFIG_CACHE = {}
+
+
+def first_of(data, *keys):
+    """Return the first truthy value among data[key] for keys, or None"""
+    for key in keys:
+        value = data.get(key)
+        if value:
+            return value
+    return None
+
+
+def _intern(value):
+    """Intern strings decoded from a feed so repeated values share one object"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
 def load_config(config_path="ProviderConfig.json"):
-    """Load configuration with error handling"""
+    """Load configuration with error handling.
+
+    The parsed file is cached and only re-read when its mtime changes, so the
+    polling loop doesn't re-parse JSON on every cycle. Callers must treat the
+    returned dict as read-only.
+    """
     try:
+        mtime = os.stat(config_path).st_mtime
+        cached = _CONFIG_CACHE.get(config_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
         with open(config_path, 'r') as file:
             config = json.load(file)
+        _CONFIG_CACHE[config_path] = (mtime, config)
         return config
     except (FileNotFoundError, json.JSONDecodeError) as e:
         logging.error(f"Failed to load config: {e}")
         return None
 
 
+def _create_http_session():
+    """Build a pooled, keep-alive session shared by every API request."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=2)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+_HTTP_SESSION = _create_http_session()
+# Upper bound on concurrent per-stop API requests
+MAX_FETCH_WORKERS = 8
+
+
+# Last validated response per URL, stored as (etag, last_modified, data), used
+# to send conditional GETs and reuse the parsed body on 304 Not Modified
+_RESPONSE_VALIDATORS = {}
+
+
 def make_api_request(url, headers=None, timeout=30):
     """Make API request with proper error handling"""
     try:
-        response = requests.get(url, headers=headers, timeout=timeout)
+        previous = _RESPONSE_VALIDATORS.get(url)
+        if previous is not None:
+            etag, last_modified, _ = previous
+            headers = dict(headers) if headers else {}
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+
+        response = _HTTP_SESSION.get(url, headers=headers, timeout=timeout)
+        if response.status_code == 304 and previous is not None:
+            # Unchanged upstream; skip the download and the JSON decode
+            return previous[2]
         response.raise_for_status()  # Raises an HTTPError for bad responses
-        return response.json()
+        # orjson decodes noticeably faster than the stdlib when it is installed
+        if _HAS_ORJSON:
+            data = orjson.loads(response.content)
+        else:
+            data = response.json()
+
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified:
+            _RESPONSE_VALIDATORS[url] = (etag, last_modified, data)
+        else:
+            _RESPONSE_VALIDATORS.pop(url, None)
+        return data
     except requests.exceptions.RequestException as e:
         logging.error(f"API request failed: {e}")
         return None
@@ -760,21 +1043,94 @@ def make_api_request(url, headers=None, timeout=30):
         return None
 
 
-def calculate_time_to_arrival(arrival_time_str):
-    """Calculate time to arrival in minutes"""
+def _iso_to_epoch(value):
+    """Convert an ISO-8601 timestamp to epoch seconds.
+
+    UTC strings of the form YYYY-MM-DDTHH:MM:SS[.ffffff]Z are sliced directly;
+    anything else goes through datetime.fromisoformat. Naive values are
+    treated as UTC.
+    """
+    if value.endswith('Z') and len(value) >= 20 and value[10] == 'T' and value[19] in '.Z':
+        epoch = calendar.timegm((
+            int(value[0:4]), int(value[5:7]), int(value[8:10]),
+            int(value[11:13]), int(value[14:16]), int(value[17:19]),
+        ))
+        if value[19] == '.':
+            epoch += float('0' + value[19:-1])
+        return epoch
+
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+# Seconds a successful response is reused; upstream feeds refresh every ~15-30s
+API_CACHE_TTL = 15
+# Parsed responses keyed by URL, stored as (expiry, data)
+_API_CACHE = {}
+# Requests currently in flight keyed by URL, so concurrent callers share one fetch
+_API_INFLIGHT = {}
+_API_CACHE_LOCK = threading.Lock()
+
+
+def cached_api_request(url, headers=None, timeout=30, ttl=API_CACHE_TTL):
+    """Return a recent response for url from the cache, fetching it when stale.
+
+    Only one request per URL is in flight at a time; callers that miss the
+    cache while it is running wait for and share its result. Failed requests
+    are not cached so the next call retries immediately.
+    """
+    now = time.monotonic()
+    with _API_CACHE_LOCK:
+        cached = _API_CACHE.get(url)
+        if cached is not None and now < cached[0]:
+            return cached[1]
+        future = _API_INFLIGHT.get(url)
+        leader = future is None
+        if leader:
+            future = _API_INFLIGHT[url] = Future()
+
+    if not leader:
+        return future.result()
+
+    data = None
+    try:
+        data = make_api_request(url, headers, timeout)
+    finally:
+        with _API_CACHE_LOCK:
+            if data is not None:
+                _API_CACHE[url] = (time.monotonic() + ttl, data)
+            del _API_INFLIGHT[url]
+        future.set_result(data)
+    return data
+
+
+def fetch_all(urls, headers=None, timeout=30):
+    """Fetch several URLs concurrently, returning the parsed responses in order"""
+    if not urls:
+        return []
+    with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(urls))) as executor:
+        return list(executor.map(lambda url: cached_api_request(url, headers, timeout), urls))
+
+
+def calculate_time_to_arrival(arrival_time_str, now_ts=None):
+    """Calculate time to arrival in minutes.
+
+    Pass ``now_ts`` (epoch seconds) to share one clock reading across a batch.
+    """
     if not arrival_time_str:
         return None
 
     try:
-        # Parse the arrival time (ISO format)
-        arrival_time = datetime.fromisoformat(arrival_time_str.replace('Z', '+00:00'))
-
-        # Get current time in the same timezone
-        current_time = datetime.now(timezone.utc)
+        arrival_epoch = _iso_to_epoch(arrival_time_str)
+        if now_ts is None:
+            now_ts = time.time()
 
         # Calculate difference in minutes
-        time_diff = arrival_time - current_time
-        minutes_to_arrival = int(time_diff.total_seconds() / 60)
+        minutes_to_arrival = int((arrival_epoch - now_ts) / 60)
 
         return minutes_to_arrival if minutes_to_arrival > 0 else 0
     except (ValueError, TypeError) as e:
@@ -782,6 +1138,9 @@ def calculate_time_to_arrival(arrival_time_str):
         return None
 
 
+_EASTERN = ZoneInfo('America/New_York')
+
+
 def format_arrival_time(arrival_time_str):
     """Format arrival time for display"""
     if not arrival_time_str:
@@ -792,76 +1151,105 @@ def format_arrival_time(arrival_time_str):
         arrival_time = datetime.fromisoformat(arrival_time_str.replace('Z', '+00:00'))
 
         # Convert to Eastern Time (MBTA is in Boston)
-        eastern = pytz.timezone('US/Eastern')
-        local_time = arrival_time.astimezone(eastern)
+        local_time = arrival_time.astimezone(_EASTERN)
 
         return local_time.strftime('%I:%M %p')
     except (ValueError, TypeError):
         return arrival_time_str
 
 
-def calculate_time_to_arrival_from_epoch(epoch_seconds):
+def calculate_time_to_arrival_from_epoch(epoch_seconds, now_ts=None):
     """Calculate minutes to arrival when provided an epoch seconds string/number."""
     if not epoch_seconds:
         return None
 
     try:
         ts = int(str(epoch_seconds))
-        arrival_time = datetime.fromtimestamp(ts, timezone.utc)
-        current_time = datetime.now(timezone.utc)
-        time_diff = arrival_time - current_time
-        minutes_to_arrival = int(time_diff.total_seconds() / 60)
+        if now_ts is None:
+            now_ts = time.time()
+        minutes_to_arrival = int((ts - now_ts) / 60)
         return minutes_to_arrival if minutes_to_arrival > 0 else 0
     except (ValueError, TypeError) as e:
         logging.warning(f"Could not parse epoch arrival time {epoch_seconds}: {e}")
         return None
 
 
-def extract_route_info(included_data, route_id):
-    """Extract route information from included data"""
-    if not included_data or not route_id:
-        return {"short_name": "Unknown", "long_name": "Unknown Route"}
+# Route info used when a response has no included data or the prediction has no route id
+DEFAULT_ROUTE = {"short_name": "Unknown", "long_name": "Unknown Route"}
+# Route info used when the route id is not among the included routes
+MISSING_ROUTE = {"short_name": "Unknown", "long_name": "Unknown Route", "route_type": 0}
 
-    for item in included_data:
-        if item.get('type') == 'route' and item.get('id') == route_id:
+
+def build_route_index(included_data):
+    """Map route id -> route information for every route in included data"""
+    index = {}
+    for item in included_data or []:
+        if item.get('type') == 'route' and item.get('id'):
             attributes = item.get('attributes', {})
-            return {
+            index[item['id']] = {
                 "short_name": attributes.get('short_name', 'Unknown'),
                 "long_name": attributes.get('long_name', 'Unknown Route'),
                 "route_type": attributes.get('type', 0)
             }
+    return index
+
 
-    return {"short_name": "Unknown", "long_name": "Unknown Route", "route_type": 0}
+ROUTE_TYPE_NAMES = {
+    0: "Light Rail",
+    1: "Heavy Rail",
+    2: "Commuter Rail",
+    3: "Bus",
+    4: "Ferry"
+}
 
 
 def get_route_type_name(route_type):
     """Convert route type number to readable name"""
-    route_types = {
-        0: "Light Rail",
-        1: "Heavy Rail",
-        2: "Commuter Rail",
-        3: "Bus",
-        4: "Ferry"
-    }
-    return route_types.get(route_type, "Transit")
+    return ROUTE_TYPE_NAMES.get(route_type, "Transit")
 
 
+_ROUTE_TYPE_BUS = get_route_type_name(3)
+_ROUTE_TYPE_SUBWAY = get_route_type_name(1)
+
+
+
+def arrival_time_key(arrival):
+    """Sort key ordering arrivals by their ISO arrival time"""
+    return arrival.arrival_time or ''
 
-def get_bus_arrivals():
-    """Get bus arrivals with comprehensive error handling"""
-    # Load configuration
-    config = load_config()
-    if config is None:
-        logging.error("Configuration not available")
-        return []
 
+def soonest_arrival_key(arrival):
+    """Sort key ordering arrivals by minutes away, unknown minutes last"""
+    minutes = arrival.minutes_to_arrival
+    # None -> large value so it sorts to the end
+    if minutes is None:
+        return (1, float('inf'), arrival.arrival_time or '')
+    return (0, int(minutes), arrival.arrival_time or '')
+
+
+# Per-provider request plans, stored as (config, plan) so a reloaded config rebuilds them
+_REQUEST_PLANS = {}
+
+
+def _request_plan(kind, config, builder):
+    """Return the request plan built from config, reusing it until config is replaced"""
+    cached = _REQUEST_PLANS.get(kind)
+    if cached is not None and cached[0] is config:
+        return cached[1]
+    plan = builder(config)
+    _REQUEST_PLANS[kind] = (config, plan)
+    return plan
+
+
+def _build_bus_requests(config):
+    """Work out the bus stop URLs, headers and limits from config (None if unusable)"""
     # Extract configuration values safely
     provider_config = config.get('transport_provider', {})
     bus_stop = config.get('bus_stop', {})
     request_settings = config.get('request_settings', {})
 
     base_url = provider_config.get('base_url')
-    endpoint_template = safe_get_nested_value(provider_config, 'endpoints', 'arrivals')
+    endpoint_template = (provider_config.get('endpoints') or {}).get('arrivals')
     api_key = provider_config.get('api_key')
     headers = provider_config.get('headers', {})
     # Support multiple stops: prefer 'bus_stops' (list), fall back to single 'bus_stop'
@@ -872,7 +1260,7 @@ def get_bus_arrivals():
     # Validate required parameters
     if not all([base_url, endpoint_template]):
         logging.error("Missing required configuration parameters")
-        return []
+        return None
 
     # The config places the '##KEY##' placeholder in base_url. Replace it there
     if api_key and base_url:
@@ -882,47 +1270,133 @@ def get_bus_arrivals():
     if base_url and ".xml" in base_url:
         base_url = base_url.replace('.xml', '.json', 1)
 
-    # Helper to parse a single response payload for a given stop name
-    def parse_arrivals_from_response(data, stop_name_local, limit):
-        parsed = []
+    # Copy headers and attach api key header if present
+    req_headers = headers.copy() if headers else {}
+    if api_key:
+        req_headers['X-API-Key'] = api_key
+
+    # Build one request per configured stop
+    stop_names = []
+    urls = []
+    for s in stops_config:
+        stop_id = s.get('id')
+        stop_name = normalize_stop_name(s.get('name', f"Stop {stop_id}"))
+        if not stop_id:
+            continue
+
+        endpoint = endpoint_template.replace("STOP_ID", stop_id)
+        stop_names.append(_intern(stop_name))
+        urls.append(f"{base_url}{endpoint}&MaximumStopVisits={max_arrivals}")
+
+    return {
+        'stop_names': stop_names,
+        'urls': urls,
+        'headers': req_headers,
+        'timeout': timeout,
+        'max_arrivals': max_arrivals,
+    }
+
+
+def _build_subway_requests(config):
+    """Work out the Transiter stop URLs, headers and limits from config (None if unusable)"""
+    provider = config.get('subway_provider')
+    stops_config = config.get('subway_stops', [])
+    request_settings = config.get('request_settings', {})
+    timeout = request_settings.get('timeout', 30)
+    max_arrivals = request_settings.get('max_arrivals', 10)
+
+    if not provider or not provider.get('base_url') or not provider.get('endpoints', {}).get('stop'):
+        # Nothing configured
+        return None
+
+    base_url = provider.get('base_url')
+    endpoint_template = provider.get('endpoints', {}).get('stop')
+    headers = provider.get('headers', {})
+
+    # Build one request per configured stop
+    stop_names = []
+    urls = []
+    for s in stops_config:
+        stop_id = s.get('id')
+        stop_name = normalize_stop_name(s.get('name', f"Stop {stop_id}"))
+        if not stop_id:
+            continue
+
+        endpoint = endpoint_template.replace('STOP_ID', stop_id)
+        stop_names.append(_intern(stop_name))
+        # Ensure proper concatenation; base_url typically ends with '/'
+        urls.append(f"{base_url}{endpoint}")
+
+    return {
+        'stop_names': stop_names,
+        'urls': urls,
+        'headers': headers,
+        'timeout': timeout,
+        'max_arrivals': max_arrivals,
+    }
+
+
+def get_bus_arrivals(config=None):
+    """Get bus arrivals with comprehensive error handling.
+
+    ``config`` is the parsed ProviderConfig.json; it is loaded when omitted.
+    """
+    # Load configuration
+    if config is None:
+        config = load_config()
+    if config is None:
+        logging.error("Configuration not available")
+        return []
+
+    plan = _request_plan('bus', config, _build_bus_requests)
+    if plan is None:
+        return []
+    max_arrivals = plan['max_arrivals']
+
+    # Helper yielding the arrivals in a single response payload for a given stop name
+    def parse_arrivals_from_response(data, stop_name_local):
         if not data:
-            return parsed
+            return
+
+        # One clock reading for every arrival in this response
+        now_ts = time.time()
 
         # SIRI response
         if isinstance(data, dict) and 'Siri' in data:
-            deliveries = data.get('Siri', {}).get('ServiceDelivery', {}).get('StopMonitoringDelivery', [])
+            siri = data.get('Siri') or {}
+            deliveries = (siri.get('ServiceDelivery') or {}).get('StopMonitoringDelivery') or []
             for delivery in deliveries:
                 visits = delivery.get('MonitoredStopVisit', [])
                 for visit in visits:
                     mvj = visit.get('MonitoredVehicleJourney', {})
-                    route_short = mvj.get('PublishedLineName') or mvj.get('LineRef') or 'Unknown'
+                    route_short = _intern(first_of(mvj, 'PublishedLineName', 'LineRef')) or 'Unknown'
                     route_long = route_short
                     direction = mvj.get('DirectionRef')
                     monitored_call = mvj.get('MonitoredCall', {})
-                    arrival_time = monitored_call.get('ExpectedArrivalTime') or monitored_call.get('AimedArrivalTime') or monitored_call.get('ExpectedDepartureTime')
-
-                    if not arrival_time:
-                        arrival_time = mvj.get('ExpectedArrivalTime') or mvj.get('AimedArrivalTime')
+                    arrival_time = (
+                        first_of(monitored_call, 'ExpectedArrivalTime', 'AimedArrivalTime', 'ExpectedDepartureTime')
+                        or first_of(mvj, 'ExpectedArrivalTime', 'AimedArrivalTime')
+                    )
 
                     if arrival_time:
-                        minutes_to_arrival = calculate_time_to_arrival(arrival_time)
-                        formatted_time = format_arrival_time(arrival_time)
-                        parsed.append({
-                            'route_short_name': route_short,
-                            'route_long_name': route_long,
-                            'route_type': get_route_type_name(3),
-                            'arrival_time': arrival_time,
-                            'formatted_time': formatted_time,
-                            'minutes_to_arrival': minutes_to_arrival,
-                            'direction_id': direction,
-                            'status': mvj.get('ProgressStatus') or mvj.get('Monitored'),
-                            'stop_name': stop_name_local
-                        })
+                        minutes_to_arrival = calculate_time_to_arrival(arrival_time, now_ts)
+                        yield Arrival(
+                            route_short_name=route_short,
+                            route_long_name=route_long,
+                            route_type=_ROUTE_TYPE_BUS,
+                            arrival_time=arrival_time,
+                            formatted_time=None,
+                            minutes_to_arrival=minutes_to_arrival,
+                            direction_id=direction,
+                            status=mvj.get('ProgressStatus') or mvj.get('Monitored'),
+                            stop_name=stop_name_local
+                        )
 
         else:
             # Fallback: assume JSON:API style
             predictions = data.get('data', [])
             included_data = data.get('included', [])
+            route_index = build_route_index(included_data)
             for prediction in predictions:
                 attributes = prediction.get('attributes', {})
                 relationships = prediction.get('relationships', {})
@@ -933,90 +1407,60 @@ def get_bus_arrivals():
                     route_relationship = relationships.get('route', {})
                     route_data = route_relationship.get('data', {})
                     route_id = route_data.get('id') if route_data else None
-                    route_info = extract_route_info(included_data, route_id)
-                    minutes_to_arrival = calculate_time_to_arrival(predicted_time)
-                    formatted_time = format_arrival_time(predicted_time)
-                    parsed.append({
-                        'route_short_name': route_info['short_name'],
-                        'route_long_name': route_info['long_name'],
-                        'route_type': get_route_type_name(route_info.get('route_type', 3)),
-                        'arrival_time': predicted_time,
-                        'formatted_time': formatted_time,
-                        'minutes_to_arrival': minutes_to_arrival,
-                        'direction_id': attributes.get('direction_id'),
-                        'status': attributes.get('status'),
-                        'stop_name': stop_name_local
-                    })
-
-        parsed.sort(key=lambda x: x['arrival_time'] if x['arrival_time'] else '')
-        return parsed[:limit]
-
-    # Iterate over configured stops and aggregate arrivals
-    all_arrivals = []
-    for s in stops_config:
-        stop_id = s.get('id')
-        stop_name = normalize_stop_name(s.get('name', f"Stop {stop_id}"))
-        if not stop_id:
-            continue
-
-        endpoint = endpoint_template.replace("STOP_ID", stop_id)
-        url = f"{base_url}{endpoint}&MaximumStopVisits={max_arrivals}"
-
-        # Copy headers and attach api key header if present
-        req_headers = headers.copy() if headers else {}
-        if api_key:
-            req_headers['X-API-Key'] = api_key
-
-        # Fetch and parse
-        data = make_api_request(url, req_headers, timeout)
-        parsed_for_stop = parse_arrivals_from_response(data, stop_name, max_arrivals)
-        all_arrivals.extend(parsed_for_stop)
-
-    # Final sort across all stops and limit total results
-    all_arrivals.sort(key=lambda x: x['arrival_time'] if x['arrival_time'] else '')
-    return all_arrivals[:max_arrivals]
+                    if included_data and route_id:
+                        route_info = route_index.get(route_id, MISSING_ROUTE)
+                    else:
+                        route_info = DEFAULT_ROUTE
+                    minutes_to_arrival = calculate_time_to_arrival(predicted_time, now_ts)
+                    yield Arrival(
+                        route_short_name=route_info['short_name'],
+                        route_long_name=route_info['long_name'],
+                        route_type=get_route_type_name(route_info.get('route_type', 3)),
+                        arrival_time=predicted_time,
+                        formatted_time=None,
+                        minutes_to_arrival=minutes_to_arrival,
+                        direction_id=attributes.get('direction_id'),
+                        status=attributes.get('status'),
+                        stop_name=stop_name_local
+                    )
+
+    # Fetch all stops concurrently; parsing stays on the calling thread
+    responses = fetch_all(plan['urls'], plan['headers'], plan['timeout'])
+
+    # Stream every stop's arrivals through a single bounded heap that keeps
+    # only the soonest max_arrivals, instead of sorting per stop and again overall
+    all_arrivals = (
+        arrival
+        for stop_name, data in zip(plan['stop_names'], responses)
+        for arrival in parse_arrivals_from_response(data, stop_name)
+    )
+    soonest = heapq.nsmallest(max_arrivals, all_arrivals, key=arrival_time_key)
+    return _finalize_arrivals(soonest)
 
 
-def get_subway_arrivals():
+def get_subway_arrivals(config=None):
     """Fetch subway arrivals from a Transiter instance (realtimerail.nyc style).
 
     Expects `subway_provider` and `subway_stops` in ProviderConfig.json. The
     Transiter stop endpoint returns `stopTimes` with `arrival.time` as epoch
-    seconds which we convert and normalize to the same arrival dict format.
+    seconds which we convert and normalize to the same Arrival record format.
+    ``config`` is the parsed ProviderConfig.json; it is loaded when omitted.
     """
-    config = load_config()
+    if config is None:
+        config = load_config()
     if config is None:
         logging.error("Configuration not available for subway provider")
         return []
 
-    provider = config.get('subway_provider')
-    stops_config = config.get('subway_stops', [])
-    request_settings = config.get('request_settings', {})
-    timeout = request_settings.get('timeout', 30)
-    max_arrivals = request_settings.get('max_arrivals', 10)
-
-    if not provider or not provider.get('base_url') or not provider.get('endpoints', {}).get('stop'):
-        # Nothing configured
+    plan = _request_plan('subway', config, _build_subway_requests)
+    if plan is None:
         return []
+    max_arrivals = plan['max_arrivals']
 
-    base_url = provider.get('base_url')
-    endpoint_template = provider.get('endpoints', {}).get('stop')
-    headers = provider.get('headers', {})
-
-    all_arrivals = []
-    for s in stops_config:
-        stop_id = s.get('id')
-        stop_name = normalize_stop_name(s.get('name', f"Stop {stop_id}"))
-        if not stop_id:
-            continue
-
-        endpoint = endpoint_template.replace('STOP_ID', stop_id)
-        # Ensure proper concatenation; base_url typically ends with '/'
-        url = f"{base_url}{endpoint}"
-
-        data = make_api_request(url, headers, timeout)
+    # Helper yielding the arrivals in a single Transiter payload for a given stop name
+    def parse_stop_times(data, stop_name):
         if not data:
-            continue
+            return
 
         # Transiter may return either a single stop object (for /stops/{id})
         # or an envelope with `stops` (for /stops?ids=...). Handle both.
@@ -1028,52 +1472,66 @@ def get_subway_arrivals():
 
         for stop_obj in stops_list:
             stop_times = stop_obj.get('stopTimes', [])
+            # Transiter lists stop times soonest first, so once this stop has
+            # contributed max_arrivals records the rest can never make the cut
+            kept = 0
             for st in stop_times:
+                if kept >= max_arrivals:
+                    break
                 arrival_epoch = safe_get_nested_value(st, 'arrival', 'time') or safe_get_nested_value(st, 'departure', 'time')
                 if not arrival_epoch:
                     continue
 
-                # Compute minutes and ISO arrival time
+                # Filter out subways less than SUBWAY_MIN_MINUTES away before doing
+                # any datetime work, since most stop times are discarded here
+                minutes_to_arrival = calculate_time_to_arrival_from_epoch(arrival_epoch, now_ts)
+                if minutes_to_arrival is None or minutes_to_arrival < SUBWAY_MIN_MINUTES:
+                    continue
+
+                # Compute ISO arrival time
                 try:
                     ts = int(str(arrival_epoch))
                     arrival_dt = datetime.fromtimestamp(ts, timezone.utc)
                     arrival_iso = arrival_dt.isoformat()
                 except Exception:
+                    ts = None
                     arrival_iso = None
 
-                minutes_to_arrival = calculate_time_to_arrival_from_epoch(arrival_epoch)
-                formatted_time = format_arrival_time(arrival_iso) if arrival_iso else "Unknown"
-
                 # Route/trip info
                 trip = st.get('trip', {})
-                route = safe_get_nested_value(trip, 'route', 'id') or safe_get_nested_value(trip, 'route', 'name')
-                destination = safe_get_nested_value(trip, 'destination', 'name') or safe_get_nested_value(st, 'destination', 'name')
-
-                all_arrivals.append({
-                    'route_short_name': route or '—',
-                    'route_long_name': destination or route or 'Subway',
-                    'route_type': get_route_type_name(1),  # Heavy rail / subway
-                    'arrival_time': arrival_iso,
-                    'formatted_time': formatted_time,
-                    'minutes_to_arrival': minutes_to_arrival,
-                    'direction_id': st.get('directionId'),
-                    'status': st.get('future', True),
-                    'stop_name': stop_name,
-                    'track': st.get('track')
-                })
+                route = _intern(safe_get_nested_value(trip, 'route', 'id') or safe_get_nested_value(trip, 'route', 'name'))
+                destination = _intern(safe_get_nested_value(trip, 'destination', 'name') or safe_get_nested_value(st, 'destination', 'name'))
+
+                yield Arrival(
+                    route_short_name=route or '—',
+                    route_long_name=destination or route or 'Subway',
+                    route_type=_ROUTE_TYPE_SUBWAY,  # Heavy rail / subway
+                    arrival_time=arrival_iso,
+                    formatted_time=None,
+                    minutes_to_arrival=minutes_to_arrival,
+                    direction_id=st.get('directionId'),
+                    status=st.get('future', True),
+                    stop_name=stop_name,
+                    track=st.get('track'),
+                    arrival_epoch=ts
+                )
+                kept += 1
 
-    # Filter out subways more than 9 minutes away
-    all_arrivals = [a for a in all_arrivals if a.get('minutes_to_arrival') is not None and a['minutes_to_arrival'] >= 10]
+    # Fetch all stops concurrently; parsing stays on the calling thread
+    responses = fetch_all(plan['urls'], plan['headers'], plan['timeout'])
 
-    # Sort by arrival_time (ISO) if available, otherwise leave order
-    def _sort_key(x):
-        try:
-            return x['arrival_time'] or ''
-        except Exception:
-            return ''
+    # One clock reading for every stop time in this refresh
+    now_ts = time.time()
 
-    all_arrivals.sort(key=_sort_key)
-    return all_arrivals[:max_arrivals]
+    # Stream every stop's records straight into the bounded heap rather than
+    # collecting them in an intermediate list first
+    all_arrivals = (
+        arrival
+        for stop_name, data in zip(plan['stop_names'], responses)
+        for arrival in parse_stop_times(data, stop_name)
+    )
+    # Keep the soonest by arrival_time (ISO)
+    return _finalize_arrivals(heapq.nsmallest(max_arrivals, all_arrivals, key=arrival_time_key))
 
 
 def display_arrivals(arrivals):
@@ -1088,14 +1546,50 @@ def display_arrivals(arrivals):
                 bus_display = MatrixBusArrivalDisplay(matrix_conf)
             except Exception as exc:
                 logging.warning(f"Matrix display failed to initialize ({exc}); falling back to pygame.")
-                bus_display = BusArrivalDisplay()
+                bus_display = BusArrivalDisplay(display_config)
         else:
-            bus_display = BusArrivalDisplay()
+            bus_display = BusArrivalDisplay(display_config)
 
     # Use the pygame display instead of console prints
     return bus_display.display_arrivals(arrivals)
 
 
+# Seconds between background fetches. Cache entries expire after the same
+# span, so each fetcher pass hits the network; the response cache and the
+# single-flight map only guard against other callers of get_*_arrivals.
+FETCH_INTERVAL = API_CACHE_TTL
+DISPLAY_INTERVAL = 1  # seconds between arrival list refreshes
+
+
+def fetch_arrivals(config, executor):
+    """Fetch bus and subway arrivals side by side, returning (bus_list, subway_list)"""
+    bus_future = executor.submit(get_bus_arrivals, config)
+    subway_future = executor.submit(get_subway_arrivals, config)
+    bus_list = []
+    subway_list = []
+
+    try:
+        bus_list = bus_future.result() or []
+    except Exception as e:
+        logging.warning(f"Error fetching bus arrivals: {e}")
+
+    try:
+        subway_list = subway_future.result() or []
+    except Exception as e:
+        logging.warning(f"Error fetching subway arrivals: {e}")
+
+    return bus_list, subway_list
+
+
+def _fetcher(q, stop_event, config, interval=FETCH_INTERVAL):
+    """Background loop publishing (bus_list, subway_list) snapshots to q"""
+    # Bus and subway providers are fetched side by side
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        while not stop_event.is_set():
+            q.put(fetch_arrivals(config, executor))
+            stop_event.wait(interval)
+
+
 def run_monitoring():
     global bus_display
 
@@ -1104,81 +1598,95 @@ def run_monitoring():
     print("❸️  Press ESC in the display window to stop")
     print()
 
+    # Load the configuration once for the whole monitoring session
+    config = load_config()
+    req_settings = (config or {}).get('request_settings', {})
+    overall_limit = req_settings.get('max_arrivals', 10)
+
+    # Network fetches run on their own thread so slow endpoints never stall the display
+    stop_event = threading.Event()
+    fetcher = threading.Thread(target=_fetcher, args=(q, stop_event, config), daemon=True)
+
     try:
+        fetcher.start()
+        # Wait for the first snapshot so the display opens with data
+        bus_list, subway_list = q.get()
+
         # Mode cycling: 'combined' -> 'subway' -> 'bus'
         modes = ['combined', 'subway', 'bus']
         mode_index = 0
         switch_interval = 20  # seconds
-        last_switch = time.time()
 
-        while True:
-            # Fetch bus and subway lists separately so we can choose which to show
-            bus_list = []
-            subway_list = []
+        # Deadlines on the monotonic clock so a slow frame delays, rather than
+        # compounds into, the next refresh or mode switch
+        next_display = time.monotonic()
+        next_switch = next_display + switch_interval
 
+        while True:
+            # Pick up the latest snapshot from the fetcher, if a new one arrived
             try:
-                bus_list = get_bus_arrivals() or []
-            except Exception as e:
-                logging.warning(f"Error fetching bus arrivals: {e}")
-
-            try:
-                subway_list = get_subway_arrivals() or []
-            except Exception as e:
-                logging.warning(f"Error fetching subway arrivals: {e}")
+                while True:
+                    bus_list, subway_list = q.get_nowait()
+            except Empty:
+                pass
 
             # Determine current mode and switch if interval passed
-            now = time.time()
-            if now - last_switch >= switch_interval:
+            now = time.monotonic()
+            if now >= next_switch:
                 mode_index = (mode_index + 1) % len(modes)
-                last_switch = now
+                next_switch += switch_interval
+                if next_switch <= now:
+                    # Fell more than an interval behind; don't switch twice in a row
+                    next_switch = now + switch_interval
                 # Update display label if already created
                 if bus_display is not None:
                     bus_display.set_view(modes[mode_index])
 
+            if now < next_display:
+                # Nothing is due yet; sleep until the earliest deadline
+                time.sleep(min(next_display, next_switch) - now)
+                continue
+
             current_mode = modes[mode_index]
 
             # Choose arrivals according to current mode
             if current_mode == 'combined':
                 # In combined mode, show at most 4 items from each provider
                 per_type_max = 4
-                arrivals = []
-                arrivals.extend(bus_list[:per_type_max])
-                arrivals.extend(subway_list[:per_type_max])
+                arrivals = bus_list[:per_type_max] + subway_list[:per_type_max]
             elif current_mode == 'subway':
-                arrivals = list(subway_list)
+                arrivals = subway_list
             else:  # 'bus'
-                arrivals = list(bus_list)
+                arrivals = bus_list
+
+            # Count down from the stored arrival times between fetches
+            arrivals = refresh_minutes(arrivals)
 
             # Interleave providers (or single provider) by soonest arrival.
+            # Providers order by ISO arrival_time, which can disagree with
+            # minutes (mixed UTC offsets, unparsed times), so select again here.
             # If minutes_to_arrival is missing, treat it as very far in the future.
             try:
-                cfg = load_config() or {}
-                req_settings = cfg.get('request_settings', {})
-                overall_limit = req_settings.get('max_arrivals', 10)
-
-                def sort_key(item):
-                    m = item.get('minutes_to_arrival')
-                    # None -> large value so it sorts to the end
-                    if m is None:
-                        return (1, float('inf'), item.get('arrival_time') or '')
-                    return (0, int(m), item.get('arrival_time') or '')
-
-                arrivals.sort(key=sort_key)
-                # Trim to overall limit across providers
-                arrivals = arrivals[:overall_limit]
+                # Keep the soonest arrivals up to the overall limit across providers
+                arrivals = heapq.nsmallest(overall_limit, arrivals, key=soonest_arrival_key)
             except Exception as e:
                 logging.warning(f"Error sorting/limiting arrivals: {e}")
 
-            # Display using pygame - returns False if user wants to quit
+            # Display using pygame - returns False if user wants to quit.
+            # The displays skip redrawing when nothing on screen changed.
             if not display_arrivals(arrivals):
                 break
 
-            # Small delay to prevent excessive CPU usage
-            time.sleep(1)
+            # Schedule the next refresh, skipping ahead if this one ran long
+            next_display += DISPLAY_INTERVAL
+            now = time.monotonic()
+            if next_display <= now:
+                next_display = now + DISPLAY_INTERVAL
 
     except KeyboardInterrupt:
         print("Monitoring stopped by user")
     finally:
+        stop_event.set()
         if bus_display:
             bus_display.cleanup()
 